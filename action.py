@@ -3,25 +3,34 @@
 
 """GitHub Action to evaluate Azure AI agents using the Azure AI Evaluation SDK."""
 
+import functools
 import inspect
 import json
 import os
 import random
+import re
+import threading
 import time
 import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import parse_qs, urlparse
 
-import azure.ai.evaluation as evals
+import orjson
 import pandas as pd
-import yaml
 from azure.ai.agents.models import Agent, MessageRole, RunStatus
-from azure.ai.evaluation import AIAgentConverter, evaluate
-from azure.ai.projects import AIProjectClient
-from azure.identity import DefaultAzureCredential
 
 import analysis
 
+# NOTE: the Azure AI Evaluation, Projects and Identity SDKs are slow to import, so they
+# are imported where they are used (validation and tests do not need them)
+if TYPE_CHECKING:
+    from azure.ai.evaluation import AIAgentConverter
+    from azure.ai.projects import AIProjectClient
+    from azure.core.pipeline.transport import RequestsTransport
+
 # NOTE: custom evaluators must be imported so evaluate() can pickle them
 
 current_dir = Path(__file__).parent
@@ -40,11 +49,71 @@ DATA_PATH = os.getenv("DATA_PATH")
 AGENT_IDS = [x.strip() for x in os.getenv("AGENT_IDS", "").split(",") if x.strip()]
 BASELINE_AGENT_ID = os.getenv("BASELINE_AGENT_ID")
 EVALUATION_RESULT_VIEW = os.getenv("EVALUATION_RESULT_VIEW")
+EVAL_CONCURRENCY = int(os.getenv("EVAL_CONCURRENCY") or 8)
+MAX_CONCURRENT_AGENTS = 4
+
+RETRY_AFTER_PATTERN = re.compile(
+    r"(?:try again|retry) in (\d+(?:\.\d+)?) seconds?", re.IGNORECASE
+)
+
+# serialize console output from concurrent simulations and evaluations
+PRINT_LOCK = threading.Lock()
+
+# evaluate() patches the openai client, sets environment variables and changes the
+# working directory for its run, and the evaluator instances are shared, so agents
+# are evaluated one at a time while the simulations of other agents continue
+EVALUATE_LOCK = threading.Lock()
+
+
+def create_http_transport(max_connections: int) -> "RequestsTransport":
+    """
+    Create an HTTP transport with a connection pool sized for concurrent requests.
+
+    requests keeps at most 10 connections per host alive by default, so with more
+    concurrent simulations the surplus connections would be discarded and every
+    later request would pay a new TCP and TLS handshake.
+
+    Args:
+        max_connections: The maximum number of connections kept alive per host.
+
+    Returns:
+        A transport to share between all clients of the project.
+    """
+    # pylint: disable=import-outside-toplevel
+    # requests and urllib3 come with azure-core, whose default transport they back
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+    from urllib3.util import Retry
+
+    # retries are handled by the SDK pipeline, so disable them in urllib3 as the
+    # SDK does for the sessions it creates
+    adapter = requests.adapters.HTTPAdapter(
+        pool_maxsize=max_connections,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return RequestsTransport(session=session)
+
+
+def get_retry_after_seconds(error) -> float | None:
+    """
+    Get the wait time suggested by a rate limit error, e.g. "Try again in 20 seconds."
+
+    Returns:
+        float | None: The suggested wait time in seconds, or None if the error has none.
+    """
+    match = RETRY_AFTER_PATTERN.search(getattr(error, "message", None) or "")
+    return float(match.group(1)) if match else None
 
 
 # pylint: disable=too-many-locals
 def simulate_question_answer(
-    ai_project: AIProjectClient, agent: Agent, input_queries: dict
+    ai_project: "AIProjectClient",
+    agent: Agent,
+    input_queries: dict,
+    converter: "AIAgentConverter | None" = None,
 ) -> dict:
     """
     Simulates a question-answering interaction with an agent.
@@ -61,6 +130,8 @@ def simulate_question_answer(
         agent (Agent): The agent instance to simulate the interaction with.
         input_queries (dict): A dictionary containing the input data for the interaction.
                       It must include a "query" key and may include "id".
+        converter (AIAgentConverter, optional): The converter used to prepare evaluation
+            data from the thread. Defaults to a new converter for `ai_project`.
 
     Returns:
         dict: A dictionary containing the evaluation input using thread data with added fields:
@@ -79,6 +150,7 @@ def simulate_question_answer(
     # Exponential backoff retry logic
     max_retries = 5
     base_wait_seconds = 2
+    max_wait_seconds = 60
     for attempt in range(max_retries):
         start_time = time.time()
         run = agent_client.runs.create_and_process(
@@ -90,15 +162,23 @@ def simulate_question_answer(
             break
 
         if run.last_error.code == "rate_limit_exceeded" and attempt < max_retries - 1:
-            # Calculate wait time with exponential backoff (2^attempt * base_wait_seconds)
-            # with a small random jitter to avoid thundering herd problem
-            jitter = random.uniform(0, 0.5)
-            wait_seconds = (2**attempt) * base_wait_seconds + jitter
-            print(
-                f"Rate limit exceeded (attempt {attempt + 1}/{max_retries}). "
-                f"You may wish to increase your quota. "
-                f"Retrying in {wait_seconds: .2f} seconds..."
-            )
+            # Honor the wait time suggested by the service (capped), otherwise use
+            # exponential backoff (2^attempt * base_wait_seconds), both with jitter so
+            # that concurrent simulations do not retry in lockstep (thundering herd)
+            retry_after_seconds = get_retry_after_seconds(run.last_error)
+            if retry_after_seconds is None:
+                wait_seconds = random.uniform(
+                    0, min(max_wait_seconds, (2**attempt) * base_wait_seconds)
+                )
+            else:
+                wait_seconds = min(max_wait_seconds, retry_after_seconds)
+                wait_seconds += random.uniform(0, base_wait_seconds)
+            with PRINT_LOCK:
+                print(
+                    f"Rate limit exceeded (attempt {attempt + 1}/{max_retries}). "
+                    f"You may wish to increase your quota. "
+                    f"Retrying in {wait_seconds: .2f} seconds..."
+                )
             time.sleep(wait_seconds)
         else:
             if run.status != RunStatus.COMPLETED:
@@ -118,18 +198,87 @@ def simulate_question_answer(
     }
 
     # Generate evaluation data from the thread
-    converter = AIAgentConverter(ai_project)
+    if converter is None:
+        # pylint: disable-next=import-outside-toplevel
+        from azure.ai.evaluation import AIAgentConverter
+
+        converter = AIAgentConverter(ai_project)
     evaluation_data = converter.prepare_evaluation_data(thread_ids=thread.id)
 
     output = evaluation_data[0]
-    output["id"] = input_queries.get(
-        "id", str(uuid.uuid4())
-    )  # Use provided ID or generate one
+    # Use provided ID or generate one (only when it is missing)
+    output["id"] = input_queries["id"] if "id" in input_queries else str(uuid.uuid4())
     output["metrics"] = metrics
 
     return output
 
 
+def simulate_question_answers(
+    ai_project: "AIProjectClient",
+    agent: Agent,
+    input_queries: list[dict],
+    max_concurrency: int = EVAL_CONCURRENCY,
+    converter: "AIAgentConverter | None" = None,
+) -> list[dict]:
+    """
+    Simulates question-answering interactions with an agent for many queries concurrently.
+
+    Each query is simulated with `simulate_question_answer`. The calls are network-bound, so
+    they are dispatched to a bounded thread pool which overlaps the waits on the agent runs.
+
+    Args:
+        ai_project (AIProjectClient): The client used to interact with the Azure AI Project.
+        agent (Agent): The agent instance to simulate the interactions with.
+        input_queries (list[dict]): The input data rows, each including a "query" key.
+        max_concurrency (int, optional): Maximum number of simulations in flight at once.
+            Defaults to the `EVAL_CONCURRENCY` environment variable, or 8.
+        converter (AIAgentConverter, optional): The converter shared by all simulations.
+            Defaults to a new converter for `ai_project`.
+
+    Returns:
+        list[dict]: The evaluation inputs in the same order as `input_queries`. Queries whose
+        simulation failed are reported and omitted.
+    """
+
+    if converter is None:
+        # pylint: disable-next=import-outside-toplevel
+        from azure.ai.evaluation import AIAgentConverter
+
+        converter = AIAgentConverter(ai_project)
+
+    def simulate(row: dict) -> dict | None:
+        try:
+            return simulate_question_answer(ai_project, agent, row, converter)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            with PRINT_LOCK:
+                print(
+                    f"An error occurred while simulating question-answer for agent {agent.id}: {e}"
+                )
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        outputs = list(executor.map(simulate, input_queries))
+
+    return [output for output in outputs if output is not None]
+
+
+@functools.lru_cache(maxsize=None)
+def get_required_init_args(evaluator_class: type) -> frozenset[str]:
+    """
+    Get the names of the arguments required to initialize an evaluator class.
+
+    Evaluator classes are module-level singletons, so the signature is inspected once
+    per class.
+    """
+    init_signature = inspect.signature(evaluator_class.__init__)
+    return frozenset(
+        k
+        for k, v in init_signature.parameters.items()
+        if (v.kind is v.POSITIONAL_OR_KEYWORD and k != "self" and v.default is v.empty)
+    )
+
+
 def create_evaluators(class_names: list[str], args_default: dict) -> dict:
     """
     Creates a dictionary of evaluators based on the provided class names and default arguments.
@@ -147,35 +296,21 @@ def create_evaluators(class_names: list[str], args_default: dict) -> dict:
         AttributeError: If the specified evaluator class is not found in the `evals` module.
         KeyError: If a required argument for an evaluator class is missing in `args_default`.
     """
-    path = Path(__file__).parent / "analysis" / "evaluator-scores.yaml"
-    with open(path, encoding="utf-8") as f:
-        evaluator_metadata = yaml.safe_load(f)
+    # pylint: disable-next=import-outside-toplevel
+    import azure.ai.evaluation as evals
+
+    evaluator_index = _evaluator_class_index()
 
     evaluators = {}
     for evaluator_search in class_names:
-        evaluator_found = None
-        for section in evaluator_metadata["sections"]:
-            for evaluator in section["evaluators"]:
-                if evaluator["class"] == evaluator_search:
-                    evaluator_found = evaluator
-                    break
-
+        evaluator_found = evaluator_index.get(evaluator_search)
         if not evaluator_found:
             print(f"Unrecognized evaluator '{evaluator_search}'")
             continue
 
         # create evaluator instance using class from evals module
         evaluator_class = getattr(evals, evaluator_found["class"])
-        init_signature = inspect.signature(evaluator_class.__init__)
-        args_required = {
-            k
-            for k, v in init_signature.parameters.items()
-            if (
-                v.kind is v.POSITIONAL_OR_KEYWORD
-                and k != "self"
-                and v.default is v.empty
-            )
-        }
+        args_required = get_required_init_args(evaluator_class)
         args_used = {k: args_default[k] for k in args_required}
 
         evaluators[evaluator_found["key"]] = evaluator_class(**args_used)
@@ -219,8 +354,7 @@ def validate_input_data(data: dict, eval_metadata: dict) -> None:
     if not data["data"]:
         raise ValueError("Input data 'data' list cannot be empty")
 
-    # Validate that each item in data has a 'query' field and check for unique IDs
-    ids = set()
+    # Validate that each item in data has a 'query' field
     for i, item in enumerate(data["data"]):
         if not isinstance(item, dict):
             raise ValueError(f"Item at index {i} in 'data' must be a dictionary")
@@ -228,17 +362,15 @@ def validate_input_data(data: dict, eval_metadata: dict) -> None:
             raise ValueError(
                 f"Item at index {i} in 'data' is missing required field 'query'"
             )
-        # Check if ID is provided, and ensure it's unique
-        if "id" in item:
-            if item["id"] in ids:
-                raise ValueError(f"Duplicate ID '{item['id']}' found in 'data'")
-            ids.add(item["id"])
+
+    # Check that the IDs provided are unique
+    ids = [item["id"] for item in data["data"] if "id" in item]
+    if len(ids) != len(set(ids)):
+        duplicate_id = next(x for x, count in Counter(ids).items() if count > 1)
+        raise ValueError(f"Duplicate ID '{duplicate_id}' found in 'data'")
 
     # Validate that all evaluator names exist in the available evaluators
-    available_evaluators = []
-    for section in eval_metadata["sections"]:
-        for evaluator in section["evaluators"]:
-            available_evaluators.append(evaluator["class"])
+    available_evaluators = index_evaluators_by_class(eval_metadata)
 
     unknown_evaluators = [
         e
@@ -251,49 +383,132 @@ def validate_input_data(data: dict, eval_metadata: dict) -> None:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _evaluator_class_index() -> dict[str, dict]:
+    """Index the cached evaluator metadata by evaluator class name."""
+    return index_evaluators_by_class(get_evaluator_metadata())
+
+
+def index_evaluators_by_class(eval_metadata: dict) -> dict[str, dict]:
+    """
+    Map each evaluator class name in the evaluator metadata to its metadata entry.
+    """
+    return {
+        evaluator["class"]: evaluator
+        for section in eval_metadata["sections"]
+        for evaluator in section["evaluators"]
+    }
+
+
 def get_evaluator_metadata() -> dict:
     """
-    Get evaluator metadata from the evaluator-scores.yaml file.
+    Get evaluator metadata from the evaluator-scores.json file.
+
+    The metadata is parsed once per process by the analysis package and shared with
+    the summary. Treat it as read-only.
     """
-    evaluator_path = Path(__file__).parent / "analysis" / "evaluator-scores.yaml"
-    with open(evaluator_path, encoding="utf-8") as f:
-        metadata = yaml.safe_load(f)
-        return metadata
+    return analysis.summary.load_score_metadata()
 
 
-# pylint: disable=too-many-nested-blocks
-def convert_pass_fail_to_boolean(
-    eval_result_data: dict, eval_metadata: dict
-) -> list[dict]:
+def get_score_directions(eval_metadata: dict) -> dict[str, bool]:
+    """
+    Map each evaluation result field to whether an increase of the score is desired.
     """
-    Convert "pass" and "fail" strings in evaluation results to booleans.
+    return {
+        f"outputs.{evaluator['key']}.{score['key']}": (
+            score["desired_direction"].lower() == "increase"
+        )
+        for section in eval_metadata["sections"]
+        for evaluator in section["evaluators"]
+        for score in evaluator["scores"]
+    }
+
+
+def get_result_columns(eval_metadata: dict, evaluator_classes: list[str]) -> set[str]:
+    """
+    Get the evaluation result columns that the analysis of the given evaluators reads.
+    """
+    return {analysis.analysis.TEST_ID} | {
+        f"outputs.{evaluator['key']}.{score['key']}"
+        for section in eval_metadata["sections"]
+        for evaluator in section["evaluators"]
+        if evaluator["class"] in evaluator_classes
+        for score in evaluator["scores"]
+    }
+
+
+def load_evaluation_output(output_path: Path) -> dict:
+    """
+    Load the evaluation output written by the Azure AI Evaluation SDK.
+
+    The SDK writes the file with the standard json module, which writes missing scores
+    and metrics as bare NaN. orjson rejects NaN, so the standard parser is used here.
+    """
+    return json.loads(output_path.read_bytes())
+
+
+def rows_to_dataframe(
+    rows: list[dict], columns: set[str] | None = None
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from evaluation result rows.
+
+    The rows are transposed into columns first, so pandas allocates each column once
+    instead of building the frame record by record. Keys missing from a row are null.
+
+    Args:
+        rows: The evaluation result rows.
+        columns: If provided, only these columns are built; other keys are dropped.
+    """
+    columns = dict.fromkeys(
+        key for row in rows for key in row if columns is None or key in columns
+    )
+    return pd.DataFrame(
+        {column: [row.get(column) for row in rows] for column in columns}, copy=False
+    )
+
+
+def convert_pass_fail_columns(
+    df_result: pd.DataFrame, eval_metadata: dict
+) -> pd.DataFrame:
     """
-    # Create a mapping of available scores
-    available_scores = {}
-    for section in eval_metadata["sections"]:
-        for evaluator in section["evaluators"]:
-            for score in evaluator["scores"]:
-                field = f"outputs.{evaluator['key']}.{score['key']}"
-                available_scores[field] = score
-
-    # Convert "pass" and "fail" strings to booleans based on the desired direction
-    #   Pass rate: pass = True, fail = False (count # passes)
-    #   Defect rate: pass = False, fail = True (count # fails)
-    eval_rows = eval_result_data["rows"]
-    for row in eval_rows:
-        for key in row:
-            if key.startswith("outputs."):
-                matching_score = available_scores.get(key, None)
-                if matching_score:
-                    is_up_good = (
-                        matching_score.get("desired_direction").lower() == "increase"
-                    )
-                    if isinstance(row[key], str):
-                        if row[key].lower() == "pass":
-                            row[key] = is_up_good
-                        elif row[key].lower() == "fail":
-                            row[key] = not is_up_good
-    return eval_rows
+    Convert "pass" and "fail" strings in an evaluation result DataFrame to booleans.
+
+    Pass rate: pass = True, fail = False (count # passes)
+    Defect rate: pass = False, fail = True (count # fails)
+
+    The DataFrame is updated in place and returned. Cells other than "pass" and "fail"
+    strings are left exactly as they are.
+    """
+    for field, is_up_good in get_score_directions(eval_metadata).items():
+        if field not in df_result.columns:
+            continue
+        column = df_result[field]
+        if not (
+            pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)
+        ):
+            continue
+
+        # only string cells are converted; e.g. booleans next to a missing row are kept
+        is_string = column.map(type).eq(str)
+        if not is_string.any():
+            continue
+        converted = (
+            column[is_string]
+            .str.lower()
+            .map({"pass": is_up_good, "fail": not is_up_good})
+            .dropna()
+        )
+        if converted.empty:
+            continue
+        if len(converted) == len(column):
+            df_result[field] = converted.astype(bool)
+        else:
+            # write back on an object copy, so other cells (e.g. None) are not cast
+            values = column.astype(object)
+            values.loc[converted.index] = converted.astype(object)
+            df_result[field] = values
+    return df_result
 
 
 # pylint: disable=too-many-locals, too-many-arguments, too-many-positional-arguments
@@ -340,12 +555,21 @@ def main(
         - The evaluation results are analyzed and summarized, with a baseline agent
           used for comparison.
     """
-    working_dir = Path(".") if working_dir is None else working_dir
+    # pylint: disable=import-outside-toplevel
+    import azure.ai.evaluation as evals
+    from azure.ai.evaluation import AIAgentConverter, evaluate
+    from azure.ai.projects import AIProjectClient
+
+    # resolve the paths now, as evaluate() changes the working directory while it runs
+    working_dir = (Path(".") if working_dir is None else working_dir).resolve()
+    # a single client, and thus connection pool, is shared by all simulations
+    max_concurrent_agents = min(len(agent_ids), MAX_CONCURRENT_AGENTS)
     project_client = AIProjectClient(
         credential=credential,
         endpoint=endpoint,
         api_version="2025-05-15-preview",
         # Evaluations yet not supported on stable (api_version="2025-05-01")
+        transport=create_http_transport(max_concurrent_agents * EVAL_CONCURRENCY),
     )
 
     parsed_url = urlparse(endpoint)
@@ -355,28 +579,20 @@ def main(
         "api_version": API_VERSION or "",
     }
 
-    agents = {id: project_client.agents.get_agent(id) for id in agent_ids}
+    # each agent is a separate round trip, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=max_concurrent_agents) as executor:
+        agents = dict(
+            zip(agent_ids, executor.map(project_client.agents.get_agent, agent_ids))
+        )
     eval_input_paths = {id: working_dir / f"eval-input_{id}.jsonl" for id in agent_ids}
     eval_output_paths = {id: working_dir / f"eval-output_{id}.json" for id in agent_ids}
 
-    # facilitate paired comparisons by adding GUIDs to input data
-    for row in input_data_set["data"]:
-        if "id" not in row:
-            row["id"] = str(uuid.uuid4())
-
-    # simulate conversations with each agent to produce evaluation inputs
-    for agent_id, agent in agents.items():
-        eval_input_paths[agent_id].unlink(missing_ok=True)
-        for row in input_data_set["data"]:
-            try:
-                eval_input = simulate_question_answer(project_client, agent, row)
-                with eval_input_paths[agent_id].open("a", encoding="utf-8") as f:
-                    f.write(json.dumps(eval_input) + "\n")
-            # pylint: disable=broad-exception-caught
-            except Exception as e:
-                print(
-                    f"An error occurred while simulating question-answer for agent {agent_id}: {e}"
-                )
+    # facilitate paired comparisons by adding GUIDs to input data; the random bytes
+    # of all missing IDs are drawn at once
+    rows_without_id = [row for row in input_data_set["data"] if "id" not in row]
+    random_bytes = os.urandom(16 * len(rows_without_id))
+    for i, row in enumerate(rows_without_id):
+        row["id"] = str(uuid.UUID(bytes=random_bytes[16 * i : 16 * (i + 1)], version=4))
 
     # create evaluator instances
     args_default = {
@@ -387,39 +603,75 @@ def main(
     }
     evaluators = create_evaluators(input_data_set["evaluators"], args_default)
 
-    # evaluate locally
-    for agent_id, agent in agents.items():
+    # only the scores that are summarized are analyzed
+    summary_evaluators = input_data_set["evaluators"] + ["OperationalMetricsEvaluator"]
+    result_columns = get_result_columns(eval_metadata, summary_evaluators)
+
+    # a single converter prepares the evaluation data of every simulated thread
+    converter = AIAgentConverter(project_client)
+
+    def run_agent(agent_id: str, agent: Agent) -> analysis.EvaluationResult:
+        # simulate conversations with the agent to produce evaluation inputs
+        eval_inputs = simulate_question_answers(
+            project_client, agent, input_data_set["data"], converter=converter
+        )
+        if not eval_inputs:
+            raise ValueError(
+                f"All simulations of agent '{agent.name}' failed, so there is no "
+                "data to evaluate"
+            )
+        eval_input_paths[agent_id].write_bytes(
+            b"".join(orjson.dumps(eval_input) + b"\n" for eval_input in eval_inputs)
+        )
+
+        # evaluate locally; the SDK scores the whole dataset as a single batch run
+        # (its concurrency is set by the PF_WORKER_COUNT environment variable)
         eval_name = (
             f"Evaluating agent '{agent.name}' upon dataset '{input_data_set['name']}'"
         )
-        evaluate(
-            data=eval_input_paths[agent_id],
-            evaluators=evaluators,
-            evaluation_name=eval_name,
-            azure_ai_project=endpoint,
-            output_path=eval_output_paths[agent_id],
-        )
+        with EVALUATE_LOCK:
+            evaluate(
+                data=eval_input_paths[agent_id],
+                evaluators=evaluators,
+                evaluation_name=eval_name,
+                azure_ai_project=endpoint,
+                output_path=eval_output_paths[agent_id],
+            )
         # display evaluation results
-        print(f"Evaluation results for agent '{agent.name}': ")
-
-    # analyze evaluation results
-    eval_results = {}
-    for agent_id, agent in agents.items():
-        with open(eval_output_paths[agent_id], encoding="utf-8") as f:
-            eval_result_data = json.load(f)
+        with PRINT_LOCK:
+            print(f"Evaluation results for agent '{agent.name}': ")
 
-        eval_rows = convert_pass_fail_to_boolean(eval_result_data, eval_metadata)
-
-        eval_results[agent_id] = analysis.EvaluationResult(
+        # analyze evaluation results
+        eval_result_data = load_evaluation_output(eval_output_paths[agent_id])
+        df_result = rows_to_dataframe(eval_result_data["rows"], result_columns)
+        return analysis.EvaluationResult(
             variant=agent.name,
             ai_foundry_url=eval_result_data["studio_url"],
-            df_result=pd.DataFrame.from_records(eval_rows),
+            df_result=convert_pass_fail_columns(df_result, eval_metadata),
         )
 
+    # agents are independent, so simulate and analyze them concurrently (evaluations
+    # are serialized by EVALUATE_LOCK)
+    with ThreadPoolExecutor(max_workers=max_concurrent_agents) as executor:
+        futures = {
+            agent_id: executor.submit(run_agent, agent_id, agent)
+            for agent_id, agent in agents.items()
+        }
+        try:
+            for future in as_completed(futures.values()):
+                future.result()
+        except Exception:
+            # fail fast: agents that have not started yet are not simulated and
+            # evaluated (agents that are already running cannot be interrupted)
+            executor.shutdown(cancel_futures=True)
+            raise
+    eval_results = {agent_id: future.result() for agent_id, future in futures.items()}
+
     baseline_agent_id = baseline_agent_id or agent_ids[0]
 
-    if eval_results[agent_id].ai_foundry_url:
-        parsed_foundry_url = urlparse(eval_results[agent_id].ai_foundry_url)
+    ai_foundry_url = eval_results[agent_ids[-1]].ai_foundry_url
+    if ai_foundry_url:
+        parsed_foundry_url = urlparse(ai_foundry_url)
         query_params = parse_qs(str(parsed_foundry_url.query))
         agent_base_url = (
             f"https://ai.azure.com/playground/agents?wsid={query_params['wsid'][0]}"
@@ -432,7 +684,7 @@ def main(
         eval_results,
         agents,
         baseline_agent_id,
-        input_data_set["evaluators"] + ["OperationalMetricsEvaluator"],
+        summary_evaluators,
         agent_base_url,
         eval_result_view,
     )
@@ -470,12 +722,16 @@ if __name__ == "__main__":
     # Load and validate input data
     try:
         input_data_path = Path(DATA_PATH)
-        input_data = json.loads(input_data_path.read_text(encoding="utf-8"))
+        # the data file is written by users, so parse it as leniently as json does
+        input_data = json.loads(input_data_path.read_bytes())
         validate_input_data(input_data, evaluator_score_metadata)
     except json.JSONDecodeError as exc:
         raise ValueError(f"Input data at {DATA_PATH} is not valid JSON") from exc
 
     # Run evaluation and output summary
+    # pylint: disable-next=ungrouped-imports
+    from azure.identity import DefaultAzureCredential
+
     SUMMARY_MD = main(
         credential=DefaultAzureCredential(),
         endpoint=AZURE_AI_PROJECT_ENDPOINT,
@@ -5,13 +5,14 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from math import isnan
+from functools import cached_property, lru_cache
+from math import comb, isnan
 from typing import Literal
 
 import numpy as np
 import pandas as pd
-from scipy.stats import binom, binomtest, t, ttest_rel, wilcoxon
-from scipy.stats.contingency import crosstab
+from scipy.special import bdtr
+from scipy.stats import binomtest, t, ttest_rel, wilcoxon
 
 SAMPLE_SIZE_THRESHOLD = 10
 TEST_ID = "inputs.id"
@@ -25,16 +26,28 @@ def mcnemar(contingency_table: np.ndarray) -> float:
 
     Citation: https://doi.org/10.1186/1471-2288-13-91
     """
-    n12 = contingency_table[0, 1]
-    n21 = contingency_table[1, 0]
+    n12 = int(contingency_table[0, 1])
+    n21 = int(contingency_table[1, 0])
     n = n12 + n21
 
-    pvalue_exact_conditional = 2 * binom.cdf(k=min(n12, n21), n=n, p=0.5)
-    pvalue_midp = pvalue_exact_conditional - binom.pmf(k=n12, n=n, p=0.5)
+    # the binomial distribution with p=0.5 is symmetric, so P(X=n12) = P(X=n21);
+    # bdtr and comb avoid the overhead of the generic scipy.stats.binom methods
+    k = min(n12, n21)
+    pvalue_exact_conditional = 2 * bdtr(k, n, 0.5)
+    pvalue_midp = pvalue_exact_conditional - comb(n, k) / 2**n
 
     return float(pvalue_midp)
 
 
+@lru_cache(maxsize=1024)
+def t_critical_value(count: int, confidence_level: float) -> float:
+    """Two-sided critical value of Student's t-distribution for a sample size.
+
+    Scores of a result share their sample size, so the value is cached.
+    """
+    return float(t.ppf(1 - (1 - confidence_level) / 2, df=count - 1))
+
+
 @dataclass
 class EvaluationResult:
     """Result from an AI evaluation"""
@@ -53,6 +66,14 @@ class EvaluationResult:
         if self.df_result[TEST_ID].duplicated().any():
             raise ValueError(f"{TEST_ID} column must be unique")
 
+    @cached_property
+    def df_indexed(self) -> pd.DataFrame:
+        """Results indexed by test ID, shared by all comparisons of this result
+
+        The view is computed once, so df_result must not be modified afterwards.
+        """
+        return self.df_result.set_index(TEST_ID)
+
 
 class EvaluationResultView(Enum):
     """Different views for displaying evaluation results
@@ -105,6 +126,11 @@ class EvaluationScore:
         if isinstance(self.desired_direction, str):
             self.desired_direction = DesiredDirection(self.desired_direction)
 
+    @property
+    def column(self) -> str:
+        """Column of the score in the evaluation results"""
+        return f"outputs.{self.evaluator}.{self.field}"
+
 
 # pylint: disable-next=too-few-public-methods
 class EvaluationScoreCI:
@@ -112,7 +138,7 @@ class EvaluationScoreCI:
 
     def __init__(self, result: EvaluationResult, score: EvaluationScore):
         # Ensure the evaluation key is present in the dataframe
-        col_score = f"outputs.{score.evaluator}.{score.field}"
+        col_score = score.column
         if col_score not in result.df_result.columns:
             raise ValueError(f"{col_score} column is required in result")
 
@@ -125,8 +151,10 @@ class EvaluationScoreCI:
         """Compute the confidence interval for the given data"""
         ci_lower = None
         ci_upper = None
+        # missing scores are skipped, as pandas does for the statistics below
+        values = data.dropna().to_numpy(dtype=float)
         if self.score.data_type == EvaluationScoreDataType.BOOLEAN:
-            result = binomtest(data.sum(), data.count())
+            result = binomtest(int(values.sum()), values.size)
             mean = result.proportion_estimate
             ci = result.proportion_ci(
                 confidence_level=confidence_level, method="wilsoncc"
@@ -136,15 +164,16 @@ class EvaluationScoreCI:
 
         elif self.score.data_type == EvaluationScoreDataType.CONTINUOUS:
             # NOTE: parametric CI does not respect score bounds (use bootstrapping if needed)
-            mean = data.mean()
-            stderr = data.std() / (self.count**0.5)
-            z_ao2 = t.ppf(1 - (1 - confidence_level) / 2, df=self.count - 1)
+            mean = values.mean()
+            std = values.std(ddof=1) if values.size > 1 else np.nan
+            stderr = std / (self.count**0.5)
+            z_ao2 = t_critical_value(self.count, confidence_level)
             ci_lower = mean - z_ao2 * stderr
             ci_upper = mean + z_ao2 * stderr
 
         elif self.score.data_type == EvaluationScoreDataType.ORDINAL:
             # NOTE: ordinal data has non-linear intervals, so we omit CI
-            mean = data.mean()
+            mean = values.mean()
             ci_lower = None
             ci_upper = None
 
@@ -164,29 +193,25 @@ class EvaluationScoreComparison:
         score: EvaluationScore,
     ):
         # Ensure the evaluation key is present in both dataframes
-        col_score = f"outputs.{score.evaluator}.{score.field}"
+        col_score = score.column
         if (
             col_score not in control.df_result.columns
             or col_score not in treatment.df_result.columns
         ):
             raise ValueError(f"{col_score} column is required in both results")
 
-        df_c = control.df_result[[TEST_ID, col_score]].rename(
-            columns={col_score: "score"}
-        )
-        df_t = treatment.df_result[[TEST_ID, col_score]].rename(
-            columns={col_score: "score"}
-        )
-
-        df_paired = df_c.merge(
-            df_t, how="inner", on=TEST_ID, suffixes=("_c", "_t"), validate="one_to_one"
+        # pair the scores by test ID (IDs are unique within each result)
+        score_c = control.df_indexed[col_score]
+        score_t = treatment.df_indexed[col_score]
+        df_paired = pd.concat(
+            [score_c, score_t], axis=1, join="inner", keys=["score_c", "score_t"]
         )
 
         # raise exception if there are unmatched rows (will cause contradictions)
-        if df_paired.shape[0] < max(df_c.shape[0], df_t.shape[0]):
+        if df_paired.shape[0] < max(score_c.shape[0], score_t.shape[0]):
             raise ValueError("Variants have unmatched evaluation results")
 
-        if df_c["score"].isnull().any() or df_t["score"].isnull().any():
+        if score_c.isnull().any() or score_t.isnull().any():
             raise ValueError("Variants have NaN evaluation results")
 
         self.score = score
@@ -202,9 +227,15 @@ class EvaluationScoreComparison:
 
     def _stat_test(self, df_paired: pd.DataFrame) -> float:
         """Perform statistical test on the paired scores"""
+        score_c = df_paired["score_c"].to_numpy(dtype=float)
+        score_t = df_paired["score_t"].to_numpy(dtype=float)
+        if np.array_equal(score_c, score_t):
+            # identical scores (e.g. deterministic evaluators) show no difference
+            return 1.0
+
         if self.score.data_type == EvaluationScoreDataType.ORDINAL:
-            diff = (df_paired["score_t"] - df_paired["score_c"]).round()
-            if (diff == 0).all():
+            diff = np.rint(score_t - score_c)
+            if not diff.any():
                 p_value = 1.0
             else:
                 # Wilcoxon signed-rank test with Pratt zero procedure
@@ -213,24 +244,20 @@ class EvaluationScoreComparison:
                 p_value = result.pvalue
 
         elif self.score.data_type == EvaluationScoreDataType.CONTINUOUS:
-            diff = df_paired["score_t"] - df_paired["score_c"]
-            if (diff == 0).all():
-                p_value = 1.0
-            elif diff.std() == 0:
+            diff = score_t - score_c
+            if diff.size > 1 and diff.std(ddof=1) == 0:
                 p_value = 0.0
             else:
                 # Paired t-test
                 # NOTE: assumes normality of the differences
                 # (may not be true for bounded scores with small samples)
-                result = ttest_rel(df_paired["score_c"], df_paired["score_t"])
+                result = ttest_rel(score_c, score_t)
                 p_value = result.pvalue
 
         elif self.score.data_type == EvaluationScoreDataType.BOOLEAN:
-            contingency_table = crosstab(
-                df_paired["score_c"],
-                df_paired["score_t"],
-                levels=([False, True], [False, True]),
-            ).count
+            # count the (control, treatment) pairs of the 2x2 contingency table
+            pair_codes = 2 * score_c.astype(np.intp) + score_t.astype(np.intp)
+            contingency_table = np.bincount(pair_codes, minlength=4).reshape(2, 2)
 
             # McNemar's test for paired nominal data
             p_value = mcnemar(contingency_table)
@@ -3,10 +3,9 @@
 
 """Render analysis results as a markdown summary"""
 
+from functools import lru_cache
 from urllib.parse import quote
 
-import pandas as pd
-
 from .analysis import (
     EvaluationResult,
     EvaluationScore,
@@ -42,18 +41,42 @@ COLOR_MAP = {
     "Information": PALE_GREY,
 }
 
+SIGNIFICANT_EFFECTS = frozenset(["Improved", "Degraded", "Changed"])
+
+SAMPLE_SIZE_WARNINGS = {
+    "Too few samples": "Insufficient observations to determine statistical significance",
+    "Zero samples": "Zero observations might indicate a problem with data collection",
+}
+
+DEFAULT_TOOLTIPS = {
+    "ImprovedStrong": "Highly statistically significant.",
+    "DegradedStrong": "Highly statistically significant.",
+    "ChangedStrong": "Highly statistically significant.",
+    "ImprovedWeak": "Marginally statistically significant.",
+    "DegradedWeak": "Marginally statistically significant.",
+    "ChangedWeak": "Marginally statistically significant.",
+    "Inconclusive": "Not statistically significant.",
+}
+
+METRIC_VALUE_SPECS = {
+    EvaluationScoreDataType.ORDINAL: ".2f",
+    EvaluationScoreDataType.CONTINUOUS: ".3g",
+    EvaluationScoreDataType.BOOLEAN: ".1%",
+}
+
+# shields.io uses dashes and underscores as separators, so they are escaped by doubling
+BADGE_ESCAPES = str.maketrans({"-": "--", "_": "__"})
+
+# newlines and quotes would end the markdown link title
+TOOLTIP_ESCAPES = str.maketrans({"\n": "&#013;", '"': "&quot;"})
+
 
 def fmt_metric_value(
     x: float, data_type: EvaluationScoreDataType, sign: bool = False
 ) -> str:
     """Format a metric value"""
-    if data_type == EvaluationScoreDataType.ORDINAL:
-        spec = ".2f"
-    elif data_type == EvaluationScoreDataType.CONTINUOUS:
-        spec = ".3g"
-    elif data_type == EvaluationScoreDataType.BOOLEAN:
-        spec = ".1%"
-    else:
+    spec = METRIC_VALUE_SPECS.get(data_type)
+    if spec is None:
         raise ValueError(f"Unsupported data type: {data_type}")
 
     if sign:
@@ -72,7 +95,7 @@ def fmt_pvalue(x: float) -> str:
 
 def fmt_hyperlink(text: str, url: str, tooltip: str = "") -> str:
     """Markdown to render a hyperlink"""
-    tooltip = tooltip.replace("\n", "&#013;").replace('"', "&quot;")
+    tooltip = tooltip.translate(TOOLTIP_ESCAPES)
     return f'[{text}]({url} "{tooltip}")'
 
 
@@ -81,6 +104,15 @@ def fmt_image(url: str, alt_text: str, tooltip: str = "") -> str:
     return "!" + fmt_hyperlink(alt_text, url, tooltip)
 
 
+@lru_cache(maxsize=1024)
+def escape_badge_text(text: str) -> str:
+    """Escape a part of a shields.io badge URL
+
+    Labels and colors come from small fixed sets, so the escaped text is cached.
+    """
+    return quote(text, safe="").translate(BADGE_ESCAPES)
+
+
 def fmt_badge(label: str, message: str, color: str, tooltip: str = "") -> str:
     """Markdown to render a badge
 
@@ -96,21 +128,17 @@ def fmt_badge(label: str, message: str, color: str, tooltip: str = "") -> str:
         Tooltip. Default: standard message for color presets, otherwise none.
     """
     if not tooltip:
-        if color.endswith("Strong"):
+        tooltip = DEFAULT_TOOLTIPS.get(color, "")
+        # other presets are classified by their significance suffix
+        if not tooltip and color.endswith("Strong"):
             tooltip = "Highly statistically significant."
-        elif color.endswith("Weak"):
+        elif not tooltip and color.endswith("Weak"):
             tooltip = "Marginally statistically significant."
-        elif color == "Inconclusive":
-            tooltip = "Not statistically significant."
-
     color = COLOR_MAP.get(
         color, color
     )  # If color isn't in map, keep the original value
 
-    def escape(s: str) -> str:
-        return quote(s, safe="").replace("-", "--").replace("_", "__")
-
-    badge_content = "-".join(map(escape, [label, message, color]))
+    badge_content = "-".join(map(escape_badge_text, [label, message, color]))
     url = f"https://img.shields.io/badge/{badge_content}"
     alt_text = f"{label}: {message}"
 
@@ -121,7 +149,7 @@ def fmt_treatment_badge(x: EvaluationScoreComparison) -> str:
     """Format a treatment effect as a badge"""
     effect = x.treatment_effect
 
-    if effect in ["Improved", "Degraded", "Changed"]:
+    if effect in SIGNIFICANT_EFFECTS:
         if x.p_value <= HSS_THRESHOLD:
             color = f"{effect}Strong"
             tooltip_stat = "Highly statistically significant"
@@ -140,12 +168,9 @@ def fmt_treatment_badge(x: EvaluationScoreComparison) -> str:
             color = "Warning"
             tooltip_stat = "Unexpected classification"
         tooltip_stat += f" (p-value: {fmt_pvalue(x.p_value)})."
-    elif effect == "Too few samples":
+    elif effect in SAMPLE_SIZE_WARNINGS:
         color = "Warning"
-        tooltip_stat = "Insufficient observations to determine statistical significance"
-    elif effect == "Zero samples":
-        color = "Warning"
-        tooltip_stat = "Zero observations might indicate a problem with data collection"
+        tooltip_stat = SAMPLE_SIZE_WARNINGS[effect]
     else:
         color = PALE_GREY
         tooltip_stat = ""
@@ -179,6 +204,52 @@ def fmt_ci(x: EvaluationScoreCI) -> str:
     return md_ci
 
 
+def fmt_table(records: list[dict], colalign: list[str] | None = None) -> str:
+    """Render records as a markdown table
+
+    Columns are the record keys in order of first appearance, padded to equal width
+    as in the pipe format of tabulate. Cells are rendered as given, without numeric
+    formatting. Columns are left-aligned unless `colalign` specifies "left" or
+    "right" per column. Missing values are rendered empty.
+    """
+    if not records:
+        return ""
+
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    rows = [[str(record.get(column, "")) for column in columns] for record in records]
+    alignments = colalign or ["left"] * len(columns)
+    widths = [
+        max(len(column) + 2, *(len(row[i]) for row in rows))
+        for i, column in enumerate(columns)
+    ]
+
+    def fmt_row(cells: list[str]) -> str:
+        padded = (
+            cell.rjust(width) if align == "right" else cell.ljust(width)
+            for cell, width, align in zip(cells, widths, alignments)
+        )
+        return "| " + " | ".join(padded) + " |"
+
+    separator = (
+        "-" * (width + 1) + ":" if align == "right" else ":" + "-" * (width + 1)
+        for width, align in zip(widths, alignments)
+    )
+    lines = [fmt_row(columns), "|" + "|".join(separator) + "|"]
+    lines.extend(fmt_row(row) for row in rows)
+    return "\n".join(lines)
+
+
+def filter_available_scores(
+    scores: list[EvaluationScore], results: list[EvaluationResult]
+) -> list[EvaluationScore]:
+    """Keep the scores with a column in every result and report the others once"""
+    available = set.intersection(*(set(x.df_result.columns) for x in results))
+    missing = [score.name for score in scores if score.column not in available]
+    if missing:
+        print(f"Skipping scores missing from the results: {', '.join(missing)}")
+    return [score for score in scores if score.column in available]
+
+
 def fmt_table_compare(
     scores: list[EvaluationScore],
     results: dict[str, EvaluationResult],
@@ -192,31 +263,41 @@ def fmt_table_compare(
         raise ValueError("No evaluator scores provided")
 
     records = []
-    for score in scores:
+    for score in filter_available_scores(scores, list(results.values())):
+        # NaN or unmatched scores are only detected by the comparison
         try:
             row = {"Evaluation score": score.name}
 
-            compare_result = EvaluationScoreComparison(
-                results[baseline], results[baseline], score=score
+            treatment_results = [
+                EvaluationScoreComparison(
+                    results[baseline], variant_result, score=score
+                )
+                for variant, variant_result in results.items()
+                if variant != baseline
+            ]
+
+            # every comparison has the baseline as control, so only compare the
+            # baseline with itself if there is no other variant
+            control_result = (
+                treatment_results[0]
+                if treatment_results
+                else EvaluationScoreComparison(
+                    results[baseline], results[baseline], score=score
+                )
             )
-            row[results[baseline].variant] = fmt_control_badge(compare_result)
-
-            for variant, variant_result in results.items():
-                if variant == baseline:
-                    continue
+            row[results[baseline].variant] = fmt_control_badge(control_result)
 
-                compare_result = EvaluationScoreComparison(
-                    results[baseline], variant_result, score=score
+            for compare_result in treatment_results:
+                row[compare_result.treatment_variant] = fmt_treatment_badge(
+                    compare_result
                 )
-                row[variant_result.variant] = fmt_treatment_badge(compare_result)
 
             records.append(row)
 
         except ValueError as e:
             print(f"Error comparing score {score.name}: {e}")
 
-    df_summary = pd.DataFrame.from_records(records)
-    return df_summary.to_markdown(index=False)
+    return fmt_table(records)
 
 
 def fmt_table_ci(scores: list[EvaluationScore], result: EvaluationResult) -> str:
@@ -225,7 +306,7 @@ def fmt_table_ci(scores: list[EvaluationScore], result: EvaluationResult) -> str
         raise ValueError("No evaluator scores provided")
 
     records = []
-    for score in scores:
+    for score in filter_available_scores(scores, [result]):
         try:
             result_ci = EvaluationScoreCI(result, score=score)
             records.append(
@@ -238,13 +319,8 @@ def fmt_table_ci(scores: list[EvaluationScore], result: EvaluationResult) -> str
                 }
             )
         except ValueError as e:
+            # e.g. a score without any value, as every row failed to evaluate
             print(f"Error comparing score {score.name}: {e}")
 
-    df_summary = pd.DataFrame.from_records(records)
-
-    if not df_summary.empty:
-        # First column (Evaluation score) left-aligned, all other columns right-aligned
-        alignments = ["left"] + ["right"] * (len(df_summary.columns) - 1)
-        return df_summary.to_markdown(index=False, colalign=alignments)
-
-    return ""
+    # First column (Evaluation score) left-aligned, all other columns right-aligned
+    return fmt_table(records, colalign=["left", "right", "right"])
@@ -8,9 +8,10 @@ of evaluation results for AI agents. It includes functions to create
 tables comparing multiple agent variants or displaying confidence intervals
 for a single agent's performance metrics.
 """
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
+import orjson
 from azure.ai.agents.models import Agent
 
 from .analysis import (
@@ -22,6 +23,51 @@ from .analysis import (
 from .render import fmt_hyperlink, fmt_table_ci, fmt_table_compare
 
 
+@lru_cache(maxsize=1)
+def load_score_metadata() -> dict:
+    """
+    Load the hardcoded evaluator score metadata.
+
+    The file is shipped with the package and immutable at runtime, so it is parsed
+    once per process. Treat the returned metadata as read-only.
+    """
+    metadata_path = Path(__file__).parent / "evaluator-scores.json"
+    return orjson.loads(metadata_path.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def load_evaluation_scores() -> (
+    dict[str, tuple[dict, tuple[tuple[dict, EvaluationScore], ...]]]
+):
+    """
+    Map each evaluator class to its metadata and the metadata and EvaluationScore of
+    each of its scores.
+
+    The scores only depend on the hardcoded metadata, so they are built once per
+    process. Treat them as read-only.
+    """
+    return {
+        evaluator["class"]: (
+            evaluator,
+            tuple(
+                (
+                    score,
+                    EvaluationScore(
+                        name=score["name"],
+                        evaluator=evaluator["key"],
+                        field=score["key"],
+                        data_type=score["type"],
+                        desired_direction=score["desired_direction"],
+                    ),
+                )
+                for score in evaluator["scores"]
+            ),
+        )
+        for section in load_score_metadata()["sections"]
+        for evaluator in section["evaluators"]
+    }
+
+
 def should_include_score(
     score: dict, evaluator: dict, result_view: EvaluationResultView
 ) -> bool:
@@ -49,6 +95,29 @@ def should_include_score(
     return result_view == EvaluationResultView.RAW_SCORES
 
 
+@lru_cache(maxsize=None)
+def get_included_scores(
+    evaluator_class: str, result_view: EvaluationResultView
+) -> tuple[EvaluationScore, ...]:
+    """
+    Get the scores of an evaluator that are included in a result view.
+
+    The selection only depends on the hardcoded metadata, so it is cached.
+
+    Raises:
+        ValueError: If the evaluator class is not in the evaluator metadata.
+    """
+    try:
+        evaluator, scores = load_evaluation_scores()[evaluator_class]
+    except KeyError as exc:
+        raise ValueError(f"Unknown evaluator '{evaluator_class}'") from exc
+    return tuple(
+        eval_score
+        for score, eval_score in scores
+        if should_include_score(score, evaluator, result_view)
+    )
+
+
 # pylint: disable-next=too-many-locals, too-many-arguments, too-many-positional-arguments
 def summarize(
     eval_results: dict[str, EvaluationResult],
@@ -77,36 +146,38 @@ def summarize(
     )
     md.append(f"## Azure AI Evaluation {view_label}\n")
 
-    def format_agent_row(agent: Agent, agent_url: str) -> str:
+    def format_agent_row(agent: Agent) -> str:
         result_url = eval_results[agent.id].ai_foundry_url
         result_link = fmt_hyperlink("Click here", result_url) if result_url else ""
-        agent_link = fmt_hyperlink(agent.id, agent_url) if agent_url else agent.id
+        agent_link = (
+            fmt_hyperlink(agent.id, agent_base_url + agent.id)
+            if agent_base_url
+            else agent.id
+        )
         return f"| {agent.name} | " f"{agent_link} | " f"{result_link} |"
 
     md.append("### Agent variants\n")
     md.append("| Agent name | Agent ID | Evaluation results |")
     md.append("|:-----------|:---------|:-------------------|")
-    md.append(format_agent_row(agents[baseline], agent_base_url + agents[baseline].id))
-
-    for agent in agents.values():
-        if agent.id != baseline:
-            md.append(format_agent_row(agent, agent_base_url + agent.id))
+    md.append(format_agent_row(agents[baseline]))
+    md.extend(
+        format_agent_row(agent)
+        for agent_id, agent in agents.items()
+        if agent_id != baseline
+    )
 
-    # load hardcoded evaluator score metadata
-    metadata_path = Path(__file__).parent / "evaluator-scores.yaml"
-    with open(metadata_path, encoding="utf-8") as f:
-        score_metadata = yaml.safe_load(f)
+    score_metadata = load_score_metadata()
 
     if len(eval_results) >= 2:
         md.append("\n### Compare evaluation scores between variants\n")
     elif len(eval_results) == 1:
         md.append("\n### Evaluation results\n")
 
+    evaluator_classes = frozenset(evaluators)
     for section in score_metadata["sections"]:
-        section_evals = [x["class"] for x in section["evaluators"]]
-        if any(x in evaluators for x in section_evals):
+        if not evaluator_classes.isdisjoint(x["class"] for x in section["evaluators"]):
             append_eval_section(
-                eval_results, baseline, evaluators, result_view, md, section
+                eval_results, baseline, evaluator_classes, result_view, md, section
             )
 
     md.append("### References\n")
@@ -128,21 +199,12 @@ def summarize(
 # pylint: disable-next=too-many-arguments, too-many-positional-arguments
 def append_eval_section(eval_results, baseline, evaluators, result_view, md, section):
     """Append a section of evaluation scores to the markdown summary."""
-    eval_scores = []
-    for evaluator in section["evaluators"]:
-        if evaluator["class"] not in evaluators:
-            continue
-        for score in evaluator["scores"]:
-            if should_include_score(score, evaluator, result_view):
-                eval_scores.append(
-                    EvaluationScore(
-                        name=score["name"],
-                        evaluator=evaluator["key"],
-                        field=score["key"],
-                        data_type=score["type"],
-                        desired_direction=score["desired_direction"],
-                    )
-                )
+    eval_scores = [
+        eval_score
+        for evaluator in section["evaluators"]
+        if evaluator["class"] in evaluators
+        for eval_score in get_included_scores(evaluator["class"], result_view)
+    ]
 
     if len(eval_scores) > 0:
         md_table = ""
@@ -0,0 +1,30 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT license.
+
+"""Regenerate analysis/evaluator-scores.json from analysis/evaluator-scores.yaml.
+
+The YAML file is the source of truth for the evaluator metadata. The action only
+reads the generated JSON file, which is faster to parse and needs no YAML parser.
+Run this script (or let the pre-commit hook run it) after editing the YAML file.
+"""
+
+import json
+from pathlib import Path
+
+import yaml
+
+ANALYSIS_DIR = Path(__file__).parent.parent / "analysis"
+
+
+def main():
+    """Convert the evaluator metadata YAML file to JSON."""
+    yaml_path = ANALYSIS_DIR / "evaluator-scores.yaml"
+    with open(yaml_path, encoding="utf-8") as f:
+        metadata = yaml.safe_load(f)
+
+    json_path = yaml_path.with_suffix(".json")
+    json_path.write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Shared fixtures for the evaluation tests."""
+
+import pandas as pd
+import pytest
+
+from analysis.analysis import (
+    DesiredDirection,
+    EvaluationScore,
+    EvaluationScoreDataType,
+)
+
+
+@pytest.fixture(scope="module")
+def df_result_1():
+    """Evaluation results of the first variant. Tests must not modify it."""
+    return pd.DataFrame(
+        {
+            "inputs.id": [1, 2, 3],
+            "outputs.fluency.score": [0.8, 0.9, 0.85],
+            "outputs.accuracy.score": [4, 5, 4],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def df_result_2():
+    """Evaluation results of the second variant. Tests must not modify it."""
+    return pd.DataFrame(
+        {
+            "inputs.id": [1, 2, 3],
+            "outputs.fluency.score": [0.6, 0.5, 0.75],
+            "outputs.accuracy.score": [3, 4, 5],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def fluency_score():
+    """Continuous score that should increase."""
+    return EvaluationScore(
+        name="fluency",
+        evaluator="fluency",
+        field="score",
+        data_type=EvaluationScoreDataType.CONTINUOUS,
+        desired_direction=DesiredDirection.INCREASE,
+    )
+
+
+@pytest.fixture(scope="module")
+def accuracy_score():
+    """Ordinal score that should decrease."""
+    return EvaluationScore(
+        name="accuracy",
+        evaluator="accuracy",
+        field="score",
+        data_type=EvaluationScoreDataType.ORDINAL,
+        desired_direction=DesiredDirection.DECREASE,
+    )
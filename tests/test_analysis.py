@@ -1,61 +1,42 @@
 """Tests for the analysis module functionality"""
 
+import json
+from dataclasses import replace
+
+import numpy as np
 import pandas as pd
 import pytest
-from action import convert_pass_fail_to_boolean
+import scipy.stats
+from action import (
+    convert_pass_fail_columns,
+    load_evaluation_output,
+    rows_to_dataframe,
+)
 
 from analysis.analysis import (
     DesiredDirection,
     EvaluationResult,
-    EvaluationScore,
     EvaluationScoreCI,
     EvaluationScoreComparison,
     EvaluationScoreDataType,
+    mcnemar,
 )
 
-data_result_1 = {
-    "inputs.id": [1, 2, 3],
-    "outputs.fluency.score": [0.8, 0.9, 0.85],
-    "outputs.accuracy.score": [4, 5, 4],
-}
-
-data_result_2 = {
-    "inputs.id": [1, 2, 3],
-    "outputs.fluency.score": [0.6, 0.5, 0.75],
-    "outputs.accuracy.score": [3, 4, 5],
-}
-
-test_score_1 = EvaluationScore(
-    name="fluency",
-    evaluator="fluency",
-    field="score",
-    data_type=EvaluationScoreDataType.CONTINUOUS,
-    desired_direction=DesiredDirection.INCREASE,
-)
-
-test_score_2 = EvaluationScore(
-    name="accuracy",
-    evaluator="accuracy",
-    field="score",
-    data_type=EvaluationScoreDataType.ORDINAL,
-    desired_direction=DesiredDirection.DECREASE,
-)
 
-
-def test_create_score():
+def test_create_score(fluency_score):
     """Test creating an evaluation score."""
-    assert test_score_1.name == "fluency"
-    assert test_score_1.evaluator == "fluency"
-    assert test_score_1.field == "score"
-    assert test_score_1.data_type == EvaluationScoreDataType.CONTINUOUS
-    assert test_score_1.desired_direction == DesiredDirection.INCREASE
+    assert fluency_score.name == "fluency"
+    assert fluency_score.evaluator == "fluency"
+    assert fluency_score.field == "score"
+    assert fluency_score.data_type == EvaluationScoreDataType.CONTINUOUS
+    assert fluency_score.desired_direction == DesiredDirection.INCREASE
 
 
-def test_create_evaluation_result():
+def test_create_evaluation_result(df_result_1):
     """Test creating an evaluation result with multiple scores"""
     result = EvaluationResult(
         variant="test_variant",
-        df_result=pd.DataFrame(data_result_1),
+        df_result=df_result_1,
         ai_foundry_url="test_url",
     )
     assert result.variant == "test_variant"
@@ -63,48 +44,46 @@ def test_create_evaluation_result():
     assert result.ai_foundry_url == "test_url"
 
 
-def test_evaluation_confidence_interval():
+def test_evaluation_result_indexed_by_test_id(df_result_1):
+    """Test that the results indexed by test ID are computed once per result"""
+    result = EvaluationResult(
+        variant="test_variant",
+        df_result=df_result_1,
+    )
+    df_indexed = result.df_indexed
+    assert df_indexed.index.tolist() == [1, 2, 3]
+    assert result.df_indexed is df_indexed
+
+
+def test_evaluation_confidence_interval(df_result_1, fluency_score):
     """Test creating a confidence interval for an evaluation result"""
     result = EvaluationResult(
         variant="test_variant",
-        df_result=pd.DataFrame(data_result_1),
+        df_result=df_result_1,
         ai_foundry_url="test_url",
     )
-    score = EvaluationScore(
-        name="fluency",
-        evaluator="fluency",
-        field="score",
-        data_type=EvaluationScoreDataType.CONTINUOUS,
-        desired_direction=DesiredDirection.INCREASE,
-    )
-    ci = EvaluationScoreCI(result, score)
+    ci = EvaluationScoreCI(result, fluency_score)
     assert ci.ci_lower == pytest.approx(0.73, rel=1e-2)
     assert ci.ci_upper == pytest.approx(0.97, rel=1e-2)
     assert ci.mean == pytest.approx(0.85, rel=1e-2)
 
 
-def test_evaluation_score_comparison():
+def test_evaluation_score_comparison(df_result_1, df_result_2, fluency_score):
     """Test comparing two evaluation results"""
     control_result = EvaluationResult(
         variant="test_variant_1",
-        df_result=pd.DataFrame(data_result_1),
+        df_result=df_result_1,
         ai_foundry_url="test_url_1",
     )
     treatment_result = EvaluationResult(
         variant="test_variant_2",
-        df_result=pd.DataFrame(data_result_2),
+        df_result=df_result_2,
         ai_foundry_url="test_url_2",
     )
-    score = EvaluationScore(
-        name="fluency",
-        evaluator="fluency",
-        field="score",
-        data_type=EvaluationScoreDataType.CONTINUOUS,
-        desired_direction=DesiredDirection.INCREASE,
+    comparison = EvaluationScoreComparison(
+        control_result, treatment_result, fluency_score
     )
 
-    comparison = EvaluationScoreComparison(control_result, treatment_result, score)
-
     assert comparison.score.name == "fluency"
     assert comparison.control_variant == "test_variant_1"
     assert comparison.treatment_variant == "test_variant_2"
@@ -116,7 +95,7 @@ def test_evaluation_score_comparison():
     assert comparison.treatment_effect == "Too few samples"
 
 
-def test_evaluation_score_comparison_ordinal():
+def test_evaluation_score_comparison_ordinal(fluency_score):
     """Test comparing two evaluation results"""
 
     ordinal_data_1 = {"inputs.id": [1, 2, 3], "outputs.fluency.score": [1, 2, 1]}
@@ -133,13 +112,7 @@ def test_evaluation_score_comparison_ordinal():
         df_result=pd.DataFrame(ordinal_data_2),
         ai_foundry_url="test_url_2",
     )
-    score = EvaluationScore(
-        name="fluency",
-        evaluator="fluency",
-        field="score",
-        data_type=EvaluationScoreDataType.ORDINAL,
-        desired_direction=DesiredDirection.INCREASE,
-    )
+    score = replace(fluency_score, data_type=EvaluationScoreDataType.ORDINAL)
 
     comparison = EvaluationScoreComparison(control_result, treatment_result, score)
 
@@ -154,7 +127,7 @@ def test_evaluation_score_comparison_ordinal():
     assert comparison.treatment_effect == "Too few samples"
 
 
-def test_evaluation_score_comparison_boolean():
+def test_evaluation_score_comparison_boolean(fluency_score):
     """Test comparing two evaluation results"""
 
     bool_data_1 = {
@@ -174,13 +147,7 @@ def test_evaluation_score_comparison_boolean():
         df_result=pd.DataFrame(bool_data_2),
         ai_foundry_url="test_url_2",
     )
-    score = EvaluationScore(
-        name="fluency",
-        evaluator="fluency",
-        field="score",
-        data_type=EvaluationScoreDataType.BOOLEAN,
-        desired_direction=DesiredDirection.INCREASE,
-    )
+    score = replace(fluency_score, data_type=EvaluationScoreDataType.BOOLEAN)
 
     comparison = EvaluationScoreComparison(control_result, treatment_result, score)
 
@@ -195,7 +162,7 @@ def test_evaluation_score_comparison_boolean():
     assert comparison.treatment_effect == "Too few samples"
 
 
-def test_evaluation_score_comparison_boolean_more_samples():
+def test_evaluation_score_comparison_boolean_more_samples(fluency_score):
     """Test comparing two evaluation results"""
 
     bool_data_1 = {
@@ -240,13 +207,7 @@ def test_evaluation_score_comparison_boolean_more_samples():
         df_result=pd.DataFrame(bool_data_2),
         ai_foundry_url="test_url_2",
     )
-    score = EvaluationScore(
-        name="fluency",
-        evaluator="fluency",
-        field="score",
-        data_type=EvaluationScoreDataType.BOOLEAN,
-        desired_direction=DesiredDirection.INCREASE,
-    )
+    score = replace(fluency_score, data_type=EvaluationScoreDataType.BOOLEAN)
 
     comparison = EvaluationScoreComparison(control_result, treatment_result, score)
 
@@ -261,24 +222,20 @@ def test_evaluation_score_comparison_boolean_more_samples():
     assert comparison.treatment_effect == "Improved"
 
 
-def test_boolean_conversion():
+def test_boolean_conversion_columns():
     """
-    Test that string pass/fail values are converted to boolean values correctly,
-    considering the desired direction of evaluation metrics.
+    Test that string pass/fail columns of an evaluation result DataFrame are converted
+    to booleans, considering the desired direction of evaluation metrics.
     """
-    # Create test data with string pass/fail values and mock evaluator metadata
-    test_data = {
-        "inputs.id": ["test1", "test2", "test3"],
-        "outputs.fluency.result": ["pass", "fail", "PASS"],  # Case variations
-        "outputs.safety.result": [
-            "FAIL",
-            "pass",
-            "fail",
-        ],  # Safety metrics are typically reversed
-        "outputs.accuracy.result": ["pass", "FAIL", "Pass"],  # Mixed case
-    }
+    df_result = pd.DataFrame(
+        {
+            "inputs.id": ["test1", "test2", "test3"],
+            "outputs.fluency.result": ["pass", "fail", "PASS"],
+            "outputs.safety.result": ["FAIL", "pass", None],
+            "outputs.fluency.score": [0.8, 0.9, 0.85],
+        }
+    )
 
-    # Mock evaluator metadata that defines desired direction
     eval_metadata = {
         "sections": [
             {
@@ -286,53 +243,146 @@ def test_boolean_conversion():
                     {
                         "key": "fluency",
                         "scores": [
-                            {"key": "result", "desired_direction": "Increase"}
-                        ],  # Higher is better
+                            {"key": "result", "desired_direction": "Increase"},
+                            {"key": "score", "desired_direction": "Increase"},
+                        ],
                     },
                     {
                         "key": "safety",
-                        "scores": [
-                            {"key": "result", "desired_direction": "Decrease"}
-                        ],  # Lower is better (for risk scores)
+                        "scores": [{"key": "result", "desired_direction": "Decrease"}],
+                    },
+                ]
+            }
+        ]
+    }
+
+    df_result = convert_pass_fail_columns(df_result, eval_metadata)
+
+    assert df_result["outputs.fluency.result"].tolist() == [True, False, True]
+    assert df_result["outputs.fluency.result"].dtype == bool
+    assert df_result["outputs.safety.result"].tolist()[:2] == [True, False]
+    assert pd.isna(df_result["outputs.safety.result"][2])
+    assert df_result["outputs.fluency.score"].tolist() == [0.8, 0.9, 0.85]
+
+
+def test_boolean_conversion_columns_keeps_other_cells():
+    """Test that cells which are not converted keep their exact value and type."""
+    df_result = pd.DataFrame(
+        {"outputs.safety.result": pd.Series(["pass", None, "FAIL", 2], dtype=object)}
+    )
+    eval_metadata = {
+        "sections": [
+            {
+                "evaluators": [
+                    {
+                        "key": "safety",
+                        "scores": [{"key": "result", "desired_direction": "Decrease"}],
                     },
+                ]
+            }
+        ]
+    }
+
+    df_result = convert_pass_fail_columns(df_result, eval_metadata)
+
+    values = df_result["outputs.safety.result"].tolist()
+    assert values[0] is False
+    assert values[1] is None
+    assert values[2] is True
+    assert values[3] == 2 and isinstance(values[3], int)
+
+
+def test_boolean_conversion_columns_without_strings():
+    """Test that cells other than strings are kept as they are."""
+    rows = [
+        {
+            "inputs.id": "test1",
+            "outputs.indirect_attack.xpia_label": True,
+            "outputs.fluency.result": "pass",
+            "outputs.safety.result": 3,
+        },
+        {
+            "inputs.id": "test2",
+            "outputs.indirect_attack.xpia_label": None,
+            "outputs.fluency.result": 1.5,
+            "outputs.safety.result": True,
+        },
+    ]
+    eval_metadata = {
+        "sections": [
+            {
+                "evaluators": [
                     {
-                        "key": "accuracy",
+                        "key": "indirect_attack",
                         "scores": [
-                            {"key": "result", "desired_direction": "Increase"}
-                        ],  # Higher is better
+                            {"key": "xpia_label", "desired_direction": "Decrease"}
+                        ],
+                    },
+                    {
+                        "key": "fluency",
+                        "scores": [{"key": "result", "desired_direction": "Increase"}],
+                    },
+                    {
+                        "key": "safety",
+                        "scores": [{"key": "result", "desired_direction": "Decrease"}],
                     },
                 ]
             }
         ]
     }
 
-    # Create a mock eval_result_data dictionary as it appears in action.py
-    eval_result_data = {"rows": []}
-    for i, test_id in enumerate(test_data["inputs.id"]):
-        row = {
-            "inputs.id": test_id,
-            "outputs.fluency.result": test_data["outputs.fluency.result"][i],
-            "outputs.safety.result": test_data["outputs.safety.result"][i],
-            "outputs.accuracy.result": test_data["outputs.accuracy.result"][i],
-        }
-        eval_result_data["rows"].append(row)
-
-    # Test the conversion logic from action.py with metadata
-    convert_pass_fail_to_boolean(eval_result_data, eval_metadata)
-
-    # Verify conversion worked correctly
-    # For fluency (higher is better): pass → True, fail → False
-    assert eval_result_data["rows"][0]["outputs.fluency.result"] is True
-    assert eval_result_data["rows"][1]["outputs.fluency.result"] is False
-    assert eval_result_data["rows"][2]["outputs.fluency.result"] is True
-
-    # For safety (lower is better): pass → False, fail → True (inverted logic)
-    # Safety metrics often work in reverse - "pass" means safe (low risk)
-    assert eval_result_data["rows"][0]["outputs.safety.result"] is True
-    assert eval_result_data["rows"][1]["outputs.safety.result"] is False
-    assert eval_result_data["rows"][2]["outputs.safety.result"] is True
-
-    # For accuracy (higher is better): pass → True, fail → False
-    assert eval_result_data["rows"][0]["outputs.accuracy.result"] is True
-    assert eval_result_data["rows"][1]["outputs.accuracy.result"] is False
-    assert eval_result_data["rows"][2]["outputs.accuracy.result"] is True
+    df_result = convert_pass_fail_columns(rows_to_dataframe(rows), eval_metadata)
+
+    assert df_result["outputs.indirect_attack.xpia_label"].tolist() == [True, None]
+    assert df_result["outputs.fluency.result"].tolist() == [True, 1.5]
+    assert df_result["outputs.safety.result"].tolist() == [3, True]
+
+
+def test_rows_to_dataframe():
+    """Test building an evaluation result DataFrame from rows with differing keys."""
+    rows = [
+        {"inputs.id": "test1", "outputs.fluency.score": 0.8},
+        {"inputs.id": "test2", "outputs.fluency.reason": "Fluent"},
+    ]
+
+    df_result = rows_to_dataframe(rows)
+
+    assert list(df_result.columns) == [
+        "inputs.id",
+        "outputs.fluency.score",
+        "outputs.fluency.reason",
+    ]
+    assert df_result["inputs.id"].tolist() == ["test1", "test2"]
+    assert df_result["outputs.fluency.score"].isna().tolist() == [False, True]
+    assert df_result["outputs.fluency.reason"].isna().tolist() == [True, False]
+
+    df_result = rows_to_dataframe(rows, {"inputs.id", "outputs.fluency.score"})
+    assert list(df_result.columns) == ["inputs.id", "outputs.fluency.score"]
+
+
+def test_load_evaluation_output_with_missing_scores(tmp_path):
+    """Test loading an evaluation output where a score is missing for a row."""
+    output_path = tmp_path / "eval-output.json"
+    rows = [
+        {"inputs.id": "test1", "outputs.fluency.fluency": 4.0},
+        {"inputs.id": "test2", "outputs.fluency.fluency": float("nan")},
+    ]
+    metrics = {"fluency.fluency": float("nan")}
+    # the SDK writes the output with json.dump, i.e. missing values as bare NaN
+    output_path.write_text(json.dumps({"rows": rows, "metrics": metrics}))
+
+    eval_result_data = load_evaluation_output(output_path)
+    df_result = rows_to_dataframe(eval_result_data["rows"])
+
+    assert df_result["outputs.fluency.fluency"].isna().tolist() == [False, True]
+
+
+@pytest.mark.parametrize("n12, n21", [(0, 0), (0, 5), (3, 1), (6, 6), (40, 25)])
+def test_mcnemar_midp(n12, n21):
+    """Test that the mid-p McNemar test matches its definition via the binomial distribution"""
+    n = n12 + n21
+    binom = scipy.stats.binom
+    expected = 2 * binom.cdf(k=min(n12, n21), n=n, p=0.5) - binom.pmf(k=n12, n=n, p=0.5)
+
+    p_value = mcnemar(np.array([[10, n12], [n21, 10]]))
+    assert p_value == pytest.approx(expected)
@@ -4,12 +4,6 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
-from test_analysis import (
-    data_result_1,
-    data_result_2,
-    test_score_1,
-    test_score_2,
-)
 
 from analysis.analysis import (
     DesiredDirection,
@@ -27,11 +21,14 @@ from analysis.render import (
     fmt_image,
     fmt_metric_value,
     fmt_pvalue,
+    fmt_table,
     fmt_table_ci,
     fmt_table_compare,
     fmt_treatment_badge,
 )
 
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+
 
 def test_fmt_metric_value():
     """Test formatting of metric values."""
@@ -81,7 +78,7 @@ def test_fmt_hyperlink(test_case, text, url, tooltip, snapshot):
     """Test formatting of hyperlinks."""
     output = fmt_hyperlink(text, url, tooltip)
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "fmt_hyperlink")
+    snapshot.snapshot_dir = SNAPSHOT_DIR / "fmt_hyperlink"
     snapshot.assert_match(output, f"{test_case}.md")
 
 
@@ -107,10 +104,16 @@ def test_fmt_badge(test_case, label, message, color, tooltip, snapshot):
     """Test formatting of badges."""
     output = fmt_badge(label, message, color, tooltip)
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "fmt_badge")
+    snapshot.snapshot_dir = SNAPSHOT_DIR / "fmt_badge"
     snapshot.assert_match(output, f"{test_case}.md")
 
 
+def test_fmt_badge_other_significance_preset():
+    """Test that other strong and weak presets get the tooltip of their strength."""
+    assert '"Highly statistically significant."' in fmt_badge("A", "B", "FooStrong")
+    assert '"Marginally statistically significant."' in fmt_badge("A", "B", "FooWeak")
+
+
 @pytest.mark.parametrize(
     "test_case, result_1, result_2",
     [
@@ -253,7 +256,7 @@ def test_fmt_badge(test_case, label, message, color, tooltip, snapshot):
         ),
     ],
 )
-def test_fmt_treatment_badge(test_case, result_1, result_2, snapshot):
+def test_fmt_treatment_badge(test_case, result_1, result_2, fluency_score, snapshot):
     """Test formatting of badges."""
 
     control_result = EvaluationResult(
@@ -264,32 +267,28 @@ def test_fmt_treatment_badge(test_case, result_1, result_2, snapshot):
     )
 
     comparison = EvaluationScoreComparison(
-        control_result, treatment_result, test_score_1
+        control_result, treatment_result, fluency_score
     )
 
     output = fmt_treatment_badge(comparison)
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "fmt_treatment_badge")
+    snapshot.snapshot_dir = SNAPSHOT_DIR / "fmt_treatment_badge"
     snapshot.assert_match(output, f"{test_case}.md")
 
 
-def test_fmt_control_badge(snapshot):
+def test_fmt_control_badge(df_result_1, df_result_2, fluency_score, snapshot):
     """Test formatting of control badges."""
 
-    control_result = EvaluationResult(
-        variant="test_variant_1", df_result=pd.DataFrame(data_result_1)
-    )
-    treatment_result = EvaluationResult(
-        variant="test_variant_2", df_result=pd.DataFrame(data_result_2)
-    )
+    control_result = EvaluationResult(variant="test_variant_1", df_result=df_result_1)
+    treatment_result = EvaluationResult(variant="test_variant_2", df_result=df_result_2)
 
     comparison = EvaluationScoreComparison(
-        control_result, treatment_result, test_score_1
+        control_result, treatment_result, fluency_score
     )
 
     output = fmt_control_badge(comparison)
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "fmt_control_badge")
+    snapshot.snapshot_dir = SNAPSHOT_DIR / "fmt_control_badge"
     snapshot.assert_match(output, "test.md")
 
 
@@ -357,25 +356,36 @@ def test_fmt_ci(test_case, result, evaluator, score_data_type, expected_contains
     assert expected_contains.lower() in output.lower()
 
 
-def test_fmt_table_compare(snapshot):
+def test_fmt_table_compare(
+    df_result_1, df_result_2, fluency_score, accuracy_score, snapshot
+):
     """Test formatting of table comparison."""
 
-    result_1 = EvaluationResult(
-        variant="test_variant_1", df_result=pd.DataFrame(data_result_1)
-    )
-    result_2 = EvaluationResult(
-        variant="test_variant_2", df_result=pd.DataFrame(data_result_2)
-    )
-    scores = [test_score_1, test_score_2]
+    result_1 = EvaluationResult(variant="test_variant_1", df_result=df_result_1)
+    result_2 = EvaluationResult(variant="test_variant_2", df_result=df_result_2)
+    scores = [fluency_score, accuracy_score]
     results = {"test_variant_1": result_1, "test_varaint_2": result_2}
 
     output = fmt_table_compare(scores, results, result_1.variant)
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "fmt_table_compare")
+    snapshot.snapshot_dir = SNAPSHOT_DIR / "fmt_table_compare"
     snapshot.assert_match(output, "test.md")
 
 
-def test_fmt_table_ci(snapshot):
+def test_fmt_table():
+    """Test rendering records as a markdown table."""
+    records = [{"Score": "fluency", "Value": "0.85"}, {"Score": "accuracy"}]
+
+    assert fmt_table(records, colalign=["left", "right"]) == (
+        "| Score    |   Value |\n"
+        "|:---------|--------:|\n"
+        "| fluency  |    0.85 |\n"
+        "| accuracy |         |"
+    )
+    assert fmt_table([]) == ""
+
+
+def test_fmt_table_ci(fluency_score, accuracy_score, snapshot):
     """Test formatting of confidence interval table."""
 
     result = EvaluationResult(
@@ -400,9 +410,48 @@ def test_fmt_table_ci(snapshot):
         ),
     )
 
-    scores = [test_score_1, test_score_2]
+    scores = [fluency_score, accuracy_score]
 
     output = fmt_table_ci(scores, result)
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "fmt_table_ci")
+    snapshot.snapshot_dir = SNAPSHOT_DIR / "fmt_table_ci"
     snapshot.assert_match(output, "test.md")
+
+
+def test_fmt_table_ci_skips_missing_scores(
+    df_result_1, fluency_score, accuracy_score, capsys
+):
+    """Test that scores without a result column are left out of the table."""
+    result = EvaluationResult(
+        variant="test_variant",
+        df_result=df_result_1.drop(columns="outputs.accuracy.score"),
+    )
+
+    output = fmt_table_ci([fluency_score, accuracy_score], result)
+
+    assert "fluency" in output
+    assert "accuracy" not in output
+    assert (
+        "Skipping scores missing from the results: accuracy" in capsys.readouterr().out
+    )
+
+
+def test_fmt_table_ci_skips_scores_without_values(df_result_1, fluency_score, capsys):
+    """Test that a score without any value is reported and left out of the table."""
+    result = EvaluationResult(
+        variant="test_variant",
+        df_result=df_result_1.assign(**{"outputs.passing.result": None}),
+    )
+    passing_score = EvaluationScore(
+        name="passing",
+        evaluator="passing",
+        field="result",
+        data_type=EvaluationScoreDataType.BOOLEAN,
+        desired_direction=DesiredDirection.INCREASE,
+    )
+
+    output = fmt_table_ci([fluency_score, passing_score], result)
+
+    assert "fluency" in output
+    assert "passing" not in output
+    assert "Error comparing score passing" in capsys.readouterr().out
@@ -2,44 +2,67 @@
 """Unit tests for the agent call retry function."""
 
 import datetime
-from unittest.mock import MagicMock, patch
+from itertools import repeat
+from types import SimpleNamespace
+from unittest.mock import call, patch
 
 import pytest
 from action import simulate_question_answer
 from azure.ai.agents.models import RunStatus  # pylint: disable=wrong-import-order
 
+RUN_COMPLETED_AT = datetime.datetime(2025, 1, 1, 12, 0, 0)
+RUN_CREATED_AT = RUN_COMPLETED_AT - datetime.timedelta(seconds=1)  # 1 second before
+
 
 class MockError:
     """Mock error class to simulate error handling in the run."""
 
-    def __init__(self, code):
+    def __init__(self, code, message=None):
         self.code = code
+        self.message = message
 
 
 class MockRun:
     """Mock run class to simulate the behavior of a run in the project client."""
 
-    def __init__(self, status, error_code=None):
+    def __init__(self, status, error_code=None, error_message=None):
         self.status = status
-        self.last_error = MockError(error_code) if error_code else None
-        self.completed_at = datetime.datetime.now()
-        self.created_at = datetime.datetime.now() - datetime.timedelta(
-            seconds=1
-        )  # 1 second ago
-        self.usage = MagicMock()
-        self.usage.completion_tokens = 100
-        self.usage.prompt_tokens = 50
+        self.last_error = MockError(error_code, error_message) if error_code else None
+        self.completed_at = RUN_COMPLETED_AT
+        self.created_at = RUN_CREATED_AT
+        self.usage = SimpleNamespace(completion_tokens=100, prompt_tokens=50)
+
+
+def fake_project_client(runs):
+    """Create a project client stand-in that returns the given runs in order."""
+    runs = iter(runs)
+    return SimpleNamespace(
+        agents=SimpleNamespace(
+            threads=SimpleNamespace(
+                create=lambda **_: SimpleNamespace(id="test_thread_id")
+            ),
+            messages=SimpleNamespace(create=lambda *_, **__: None),
+            runs=SimpleNamespace(create_and_process=lambda **_: next(runs)),
+        )
+    )
+
+
+def fake_converter():
+    """Create a converter stand-in to avoid actual file operations."""
+    return SimpleNamespace(
+        prepare_evaluation_data=lambda **_: [
+            {"query": "test query", "response": "test response"}
+        ]
+    )
 
 
-@patch("time.sleep")
-def test_exponential_backoff(mock_sleep):
-    """Test that the retry logic uses exponential backoff with appropriate wait times."""
-    # Setup mocks
-    mock_project_client = MagicMock()
-    mock_agent = MagicMock()
-    mock_thread = MagicMock()
-    mock_thread.id = "test_thread_id"
+FAKE_AGENT = SimpleNamespace(id="test_agent_id")
 
+
+@patch("time.sleep")
+@patch("random.uniform", side_effect=lambda low, high: low)
+def test_exponential_backoff(mock_uniform, mock_sleep):
+    """Test that the retry logic uses exponential backoff with full jitter."""
     # Sequence of mock runs: 3 rate limit errors followed by success
     mock_runs = [
         MockRun(RunStatus.FAILED, "rate_limit_exceeded"),  # First attempt fails
@@ -48,63 +71,96 @@ def test_exponential_backoff(mock_sleep):
         MockRun(RunStatus.COMPLETED),  # Fourth attempt succeeds
     ]
 
-    # Configure the mocks
-    mock_project_client.agents.threads.create.return_value = mock_thread
-    mock_project_client.agents.runs.create_and_process.side_effect = mock_runs
-    mock_converter = MagicMock()
+    # Call the function
+    input_data = {"query": "test query", "id": "test_id_1"}
+    simulate_question_answer(
+        fake_project_client(mock_runs), FAKE_AGENT, input_data, fake_converter()
+    )
 
-    # Patch AIAgentConverter to avoid actual file operations
-    with patch("action.AIAgentConverter") as action_mock_converter:
-        action_mock_converter.return_value = mock_converter
-        mock_converter.prepare_evaluation_data.return_value = [
-            {"query": "test query", "response": "test response"}
-        ]
+    # Assert exponential backoff was used: three retries before success
+    assert mock_sleep.call_count == 3
 
-        # Call the function
-        input_data = {"query": "test query", "id": "test_id_1"}
-        simulate_question_answer(mock_project_client, mock_agent, input_data)
+    # Check the wait times follow full jitter: drawn between 0 and an exponential cap
+    assert mock_uniform.call_args_list == [call(0, 2), call(0, 4), call(0, 8)]
+    wait_times = [call_args[0][0] for call_args in mock_sleep.call_args_list]
+    assert wait_times == [0, 0, 0]
 
-        # Assert exponential backoff was used with correct wait times
-        assert mock_sleep.call_count == 3  # Three retries before success
 
-        # Check the wait times follow exponential pattern (base=2, with some jitter)
-        # We can't check exact values due to random jitter, but we can verify the pattern
-        wait_times = [call_args[0][0] for call_args in mock_sleep.call_args_list]
+@patch("time.sleep")
+@patch("random.uniform", side_effect=lambda low, high: high)
+def test_exponential_backoff_upper_bound(_, mock_sleep):
+    """Test that the upper bound of the jittered wait time doubles with each retry."""
+    mock_runs = [
+        MockRun(RunStatus.FAILED, "rate_limit_exceeded"),
+        MockRun(RunStatus.FAILED, "rate_limit_exceeded"),
+        MockRun(RunStatus.FAILED, "rate_limit_exceeded"),
+        MockRun(RunStatus.COMPLETED),
+    ]
 
-        # First retry should be ~2 seconds
-        assert 1.5 <= wait_times[0] <= 2.5
+    input_data = {"query": "test query", "id": "test_id_1"}
+    simulate_question_answer(
+        fake_project_client(mock_runs), FAKE_AGENT, input_data, fake_converter()
+    )
 
-        # Second retry should be ~4 seconds
-        assert 3.5 <= wait_times[1] <= 4.5
+    wait_times = [call_args[0][0] for call_args in mock_sleep.call_args_list]
+    assert wait_times == [2, 4, 8]
 
-        # Third retry should be ~8 seconds
-        assert 7.5 <= wait_times[2] <= 8.5
 
-        # Each wait time should be approximately double the previous (allowing for more jitter)
-        assert 1.5 <= wait_times[1] / wait_times[0] <= 2.5
-        assert 1.5 <= wait_times[2] / wait_times[1] <= 2.5
+@patch("time.sleep")
+@patch("random.uniform", side_effect=lambda low, high: high)
+def test_retry_after_is_honored(mock_uniform, mock_sleep):
+    """Test that the wait time suggested by the rate limit error is used with jitter."""
+    mock_runs = [
+        MockRun(
+            RunStatus.FAILED,
+            "rate_limit_exceeded",
+            "Rate limit is exceeded. Try again in 7 seconds.",
+        ),
+        MockRun(RunStatus.COMPLETED),
+    ]
+
+    input_data = {"query": "test query", "id": "test_id_1"}
+    output = simulate_question_answer(
+        fake_project_client(mock_runs), FAKE_AGENT, input_data, fake_converter()
+    )
+
+    # the suggested wait plus up to the base wait time, so retries are spread out
+    mock_uniform.assert_called_once_with(0, 2)
+    mock_sleep.assert_called_once_with(9.0)
+    assert output["metrics"]["server-run-duration-in-seconds"] == 1.0
+
+
+@patch("time.sleep")
+@patch("random.uniform", side_effect=lambda low, high: low)
+def test_retry_after_is_capped(_, mock_sleep):
+    """Test that a long wait time suggested by the rate limit error is capped."""
+    mock_runs = [
+        MockRun(
+            RunStatus.FAILED,
+            "rate_limit_exceeded",
+            "Rate limit is exceeded. Try again in 600 seconds.",
+        ),
+        MockRun(RunStatus.COMPLETED),
+    ]
+
+    input_data = {"query": "test query", "id": "test_id_1"}
+    simulate_question_answer(
+        fake_project_client(mock_runs), FAKE_AGENT, input_data, fake_converter()
+    )
+
+    mock_sleep.assert_called_once_with(60)
 
 
 @patch("time.sleep")
 def test_retry_fails_after_max_attempts(mock_sleep):
     """Test that the function gives up after max retries."""
-    # Setup mocks
-    mock_project_client = MagicMock()
-    mock_agent = MagicMock()
-    mock_thread = MagicMock()
-    mock_thread.id = "test_thread_id"
-
     # All attempts fail with rate limit errors
-    mock_runs = [MockRun(RunStatus.FAILED, "rate_limit_exceeded") for _ in range(5)]
-
-    # Configure the mocks
-    mock_project_client.agents.threads.create.return_value = mock_thread
-    mock_project_client.agents.runs.create_and_process.side_effect = mock_runs
+    mock_runs = repeat(MockRun(RunStatus.FAILED, "rate_limit_exceeded"), 5)
 
     # Call the function, expecting it to raise an exception
     input_data = {"query": "test query", "id": "test_id_1"}
     with pytest.raises(ValueError):
-        simulate_question_answer(mock_project_client, mock_agent, input_data)
+        simulate_question_answer(fake_project_client(mock_runs), FAKE_AGENT, input_data)
 
     # Verify all retries were attempted
     assert mock_sleep.call_count == 4  # 5 attempts, 4 sleeps
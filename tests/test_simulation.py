@@ -0,0 +1,49 @@
+"""Unit tests for the concurrent agent simulation function."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from action import create_http_transport, simulate_question_answers
+
+
+def test_simulation_preserves_input_order():
+    """Test that results are returned in input order even when calls finish out of order."""
+
+    def fake_simulate(_, __, row, ___):
+        # later rows finish first
+        time.sleep(0.01 * (3 - row["id"]))
+        return {"id": row["id"]}
+
+    rows = [{"id": 0, "query": "a"}, {"id": 1, "query": "b"}, {"id": 2, "query": "c"}]
+    with patch("action.simulate_question_answer", side_effect=fake_simulate):
+        outputs = simulate_question_answers(
+            MagicMock(), MagicMock(), rows, 3, converter=MagicMock()
+        )
+
+    assert [output["id"] for output in outputs] == [0, 1, 2]
+
+
+def test_simulation_skips_failed_queries():
+    """Test that a failed simulation is reported and omitted without failing the others."""
+
+    def fake_simulate(_, __, row, ___):
+        if row["id"] == 1:
+            raise ValueError("Run failed to complete")
+        return {"id": row["id"]}
+
+    rows = [{"id": 0, "query": "a"}, {"id": 1, "query": "b"}, {"id": 2, "query": "c"}]
+    with patch("action.simulate_question_answer", side_effect=fake_simulate):
+        outputs = simulate_question_answers(
+            MagicMock(), MagicMock(), rows, 2, converter=MagicMock()
+        )
+
+    assert [output["id"] for output in outputs] == [0, 2]
+
+
+def test_http_transport_pool_size():
+    """Test that the HTTP transport keeps enough connections alive for all simulations."""
+    transport = create_http_transport(32)
+
+    adapter = transport.session.get_adapter("https://example.com")
+    assert adapter._pool_maxsize == 32  # pylint: disable=protected-access
+    assert not adapter.max_retries.total
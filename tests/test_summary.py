@@ -4,13 +4,18 @@ Tests for the summary functionality in the analysis module.
 The tests use snapshot testing to verify the output matches expected results.
 """
 
+import json
 from pathlib import Path
 
 import pandas as pd
+import pytest
+import yaml
 from azure.ai.agents.models import Agent
 
 from analysis.analysis import EvaluationResult, EvaluationResultView
-from analysis.summary import summarize
+from analysis.summary import get_included_scores, summarize
+
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots" / "summarize"
 
 agent_1 = Agent(id="agent.v1", name="agent_version_1")
 agent_2 = Agent(id="agent.v2", name="agent_version_2")
@@ -28,14 +33,29 @@ data_result_2 = {
 }
 
 
-def test_summarize_one_variant(snapshot):
-    """Test summary of the analysis for 1 variant."""
-
-    result_1 = EvaluationResult(
+@pytest.fixture(name="result_1", scope="module")
+def fixture_result_1():
+    """Evaluation result of the first agent. Tests must not modify it."""
+    return EvaluationResult(
         variant=agent_1.id,
         df_result=pd.DataFrame(data_result_1),
         ai_foundry_url="test_url_1",
     )
+
+
+@pytest.fixture(name="result_2", scope="module")
+def fixture_result_2():
+    """Evaluation result of the second agent. Tests must not modify it."""
+    return EvaluationResult(
+        variant=agent_2.id,
+        df_result=pd.DataFrame(data_result_2),
+        ai_foundry_url="test_url_1",
+    )
+
+
+def test_summarize_one_variant(result_1, snapshot):
+    """Test summary of the analysis for 1 variant."""
+
     results = {agent_1.id: result_1}
     agents = {agent_1.id: agent_1}
     output = summarize(
@@ -47,23 +67,13 @@ def test_summarize_one_variant(snapshot):
         result_view=EvaluationResultView.ALL,
     )
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "summarize")
+    snapshot.snapshot_dir = SNAPSHOT_DIR
     snapshot.assert_match(output, "one_variant.md")
 
 
-def test_summarize_multiple_variants(snapshot):
+def test_summarize_multiple_variants(result_1, result_2, snapshot):
     """Test summary of the analysis for multiple variants."""
 
-    result_1 = EvaluationResult(
-        variant=agent_1.id,
-        df_result=pd.DataFrame(data_result_1),
-        ai_foundry_url="test_url_1",
-    )
-    result_2 = EvaluationResult(
-        variant=agent_2.id,
-        df_result=pd.DataFrame(data_result_2),
-        ai_foundry_url="test_url_1",
-    )
     results = {agent_1.id: result_1, agent_2.id: result_2}
 
     agents = {agent_1.id: agent_1, agent_2.id: agent_2}
@@ -76,7 +86,7 @@ def test_summarize_multiple_variants(snapshot):
         result_view=EvaluationResultView.ALL,
     )
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "summarize")
+    snapshot.snapshot_dir = SNAPSHOT_DIR
     snapshot.assert_match(output, "two_variants.md")
 
 
@@ -130,7 +140,46 @@ def test_summary_with_different_views(snapshot):
         result_view=EvaluationResultView.RAW_SCORES,
     )
 
-    snapshot.snapshot_dir = Path("tests", "snapshots", "summarize")
+    snapshot.snapshot_dir = SNAPSHOT_DIR
     snapshot.assert_match(default_output, "default_view.md")
     snapshot.assert_match(all_output, "all_view.md")
     snapshot.assert_match(raw_output, "raw_scores_view.md")
+
+
+def test_evaluator_scores_json_in_sync():
+    """Test that the generated evaluator-scores.json matches evaluator-scores.yaml."""
+    analysis_dir = Path(__file__).parent.parent / "analysis"
+    with open(analysis_dir / "evaluator-scores.yaml", encoding="utf-8") as f:
+        yaml_metadata = yaml.safe_load(f)
+    with open(analysis_dir / "evaluator-scores.json", encoding="utf-8") as f:
+        json_metadata = json.load(f)
+
+    assert json_metadata == yaml_metadata, (
+        "evaluator-scores.json is out of date, "
+        "run scripts/generate_evaluator_scores.py"
+    )
+
+
+def test_summarize_without_agent_base_url(result_1):
+    """Test that agent IDs are not linked when there is no agent base URL."""
+    result = EvaluationResult(variant=agent_1.id, df_result=result_1.df_result)
+    output = summarize(
+        eval_results={agent_1.id: result},
+        agents={agent_1.id: agent_1},
+        baseline=agent_1.id,
+        evaluators=["FluencyEvaluator"],
+        agent_base_url=None,
+        result_view=EvaluationResultView.ALL,
+    )
+
+    assert f"| {agent_1.name} | {agent_1.id} |  |" in output
+
+
+def test_get_included_scores():
+    """Test selecting the scores of an evaluator that a result view includes."""
+    scores = get_included_scores("FluencyEvaluator", EvaluationResultView.ALL)
+
+    assert isinstance(scores, tuple)
+    assert [score.evaluator for score in scores] == ["fluency"] * len(scores)
+    with pytest.raises(ValueError, match="Unknown evaluator 'NoSuchEvaluator'"):
+        get_included_scores("NoSuchEvaluator", EvaluationResultView.ALL)
@@ -38,16 +38,14 @@ def test_missing_required_fields():
         "data": [{"query": "test query"}],
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="missing required fields"):
         validate_input_data(invalid_data_1, eval_metadata)
-    assert "missing required fields" in str(excinfo.value)
 
     # Missing evaluators field
     invalid_data_2 = {"name": "Test Dataset", "data": [{"query": "test query"}]}
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="missing required fields"):
         validate_input_data(invalid_data_2, eval_metadata)
-    assert "missing required fields" in str(excinfo.value)
 
     # Missing data field
     invalid_data_3 = {
@@ -55,9 +53,8 @@ def test_missing_required_fields():
         "evaluators": ["IntentResolutionEvaluator"],
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="missing required fields"):
         validate_input_data(invalid_data_3, eval_metadata)
-    assert "missing required fields" in str(excinfo.value)
 
 
 def test_invalid_field_types():
@@ -69,9 +66,8 @@ def test_invalid_field_types():
         "data": [{"query": "test query"}],
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="must be a string"):
         validate_input_data(invalid_data_1, eval_metadata)
-    assert "must be a string" in str(excinfo.value)
 
     # Invalid evaluators type
     invalid_data_2 = {
@@ -80,9 +76,8 @@ def test_invalid_field_types():
         "data": [{"query": "test query"}],
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="must be a list"):
         validate_input_data(invalid_data_2, eval_metadata)
-    assert "must be a list" in str(excinfo.value)
 
     # Invalid data type
     invalid_data_3 = {
@@ -91,9 +86,8 @@ def test_invalid_field_types():
         "data": "test query",  # Should be a list
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="must be a list"):
         validate_input_data(invalid_data_3, eval_metadata)
-    assert "must be a list" in str(excinfo.value)
 
 
 def test_data_item_validation():
@@ -105,9 +99,8 @@ def test_data_item_validation():
         "data": [{"id": "test_01"}],  # Missing required query field
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="missing required field 'query'"):
         validate_input_data(invalid_data, eval_metadata)
-    assert "missing required field 'query'" in str(excinfo.value)
 
     # Data item is not a dictionary
     invalid_data_2 = {
@@ -116,9 +109,8 @@ def test_data_item_validation():
         "data": ["This is just a string"],  # Should be a dictionary
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="must be a dictionary"):
         validate_input_data(invalid_data_2, eval_metadata)
-    assert "must be a dictionary" in str(excinfo.value)
 
 
 def test_unknown_evaluator_validation():
@@ -129,9 +121,8 @@ def test_unknown_evaluator_validation():
         "data": [{"query": "test query"}],
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="Unknown evaluators specified"):
         validate_input_data(invalid_data, eval_metadata)
-    assert "Unknown evaluators specified" in str(excinfo.value)
 
 
 def test_duplicate_id_validation():
@@ -147,9 +138,8 @@ def test_duplicate_id_validation():
         ],
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="Duplicate ID 'duplicate_id' found in 'data'"):
         validate_input_data(invalid_data, eval_metadata)
-    assert "Duplicate ID 'duplicate_id' found in 'data'" in str(excinfo.value)
 
     # Test empty data list
     invalid_empty_data = {
@@ -158,6 +148,5 @@ def test_duplicate_id_validation():
         "data": [],
     }
 
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="cannot be empty"):
         validate_input_data(invalid_empty_data, eval_metadata)
-    assert "cannot be empty" in str(excinfo.value)